@@ -1,34 +1,68 @@
 """Binance Futures API client wrapper."""
 
+import functools
+import hashlib
+import hmac
+import json
 import os
+import time
+from decimal import Decimal
+from pathlib import Path
+
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from bot.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to python-binance's stdlib json
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Credentials are read from the environment (and .env) once per process
+load_dotenv()
+
+_API_KEY = os.getenv('BINANCE_API_KEY')
+_API_SECRET = os.getenv('BINANCE_API_SECRET')
+_TESTNET_URL = os.getenv(
+    'BINANCE_TESTNET_URL',
+    'https://testnet.binancefuture.com'
+)
+
+# Step/tick sizes rarely change, so they are kept on disk between runs and
+# one-shot CLI orders don't download the full exchange info every time
+SYMBOL_FILTERS_FILE = Path(__file__).parent.parent / ".cache" / "symbol_filters.json"
+SYMBOL_FILTERS_TTL = 24 * 60 * 60  # seconds
+
 
 class BinanceClient:
     """Wrapper for Binance Futures API client with testnet support."""
 
-    def __init__(self):
+    def __init__(self, verify=True):
         """
-        Initialize Binance client with credentials from environment variables.
+        Initialize Binance client with credentials loaded from the
+        environment when this module was imported.
+
+        Args:
+            verify: Run test_connection() after construction. Pass False to
+                    skip the signed round trip and verify later on demand.
 
         Raises:
             ValueError: If API credentials are missing
             BinanceRequestException: If connection test fails
         """
-        load_dotenv()
+        self.api_key = _API_KEY
+        self.api_secret = _API_SECRET
+        self.testnet_url = _TESTNET_URL
 
-        self.api_key = os.getenv('BINANCE_API_KEY')
-        self.api_secret = os.getenv('BINANCE_API_SECRET')
-        self.testnet_url = os.getenv(
-            'BINANCE_TESTNET_URL',
-            'https://testnet.binancefuture.com'
-        )
+        # symbol -> (LOT_SIZE step, MARKET_LOT_SIZE step, tickSize),
+        # loaded on first get_symbol_filters()
+        self._symbol_filters = None
+        self._symbol_filters_from_disk = False
 
         if not self.api_key or not self.api_secret:
             logger.error("Missing BINANCE_API_KEY or BINANCE_API_SECRET in environment")
@@ -46,17 +80,51 @@ class BinanceClient:
             testnet=True
         )
 
+        # Sign requests from a pre-keyed HMAC state instead of re-deriving
+        # the key pads from the secret on every signed call
+        self._hmac_template = hmac.new(
+            self.api_secret.encode('utf-8'),
+            digestmod=hashlib.sha256
+        )
+        self.client._hmac_signature = self._hmac_signature
+
+        # Keep each response local to its request so concurrent orders
+        # (OrderService.place_orders) can share this client safely
+        self.client._request = self._request
+
+        # Parse responses with orjson when it is installed
+        if orjson is not None:
+            self.client._handle_response = _handle_response
+
         # Override base URLs for testnet
         self.client.API_URL = f"{self.testnet_url}/api"
         self.client.API_TESTNET_URL = f"{self.testnet_url}/api"
 
-        # Test connection
-        self.test_connection()
+        # Keep connections alive and pooled so repeated orders reuse the
+        # same TLS session instead of paying a new handshake each time
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=0
+        )
+        self.client.session.mount('https://', adapter)
+        self.client.session.headers.update({'Connection': 'keep-alive'})
+
+        if verify:
+            self.test_connection()
 
     def test_connection(self):
         """
         Test connection to Binance API and verify credentials.
 
+        Uses the signed account balance endpoint, whose small response is
+        enough to prove both reachability and valid credentials without
+        downloading the full account snapshot (positions and assets).
+
+        Returns:
+            bool: True if the connection and credentials are valid
+
         Raises:
             BinanceAPIException: If API credentials are invalid
             BinanceRequestException: If connection fails
@@ -64,19 +132,53 @@ class BinanceClient:
         try:
             logger.info("Testing connection to Binance Futures Testnet")
             # Use authenticated call to verify API credentials
-            account = self.client.futures_account()
+            self.client.futures_account_balance()
             logger.info("Successfully connected to Binance Futures Testnet and verified API credentials")
             return True
         except BinanceAPIException as e:
-            logger.error(f"API error during connection test: {e.status_code} - {e.message}")
+            logger.error("API error during connection test: %s - %s", e.status_code, e.message)
             raise
         except BinanceRequestException as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during connection test: {str(e)}")
+            logger.error("Unexpected error during connection test: %s", e)
             raise
 
+    def _hmac_signature(self, query_string):
+        """
+        Sign a query string with the cached HMAC-SHA256 key state.
+
+        Args:
+            query_string: Ordered, URL-encoded request parameters
+
+        Returns:
+            str: Hex-encoded signature
+        """
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode('utf-8'))
+        return mac.hexdigest()
+
+    def _request(self, method, uri, signed, force_params=False, **kwargs):
+        """
+        Send a request through the shared session without shared state.
+
+        python-binance's Client._request stores the reply on
+        ``self.response`` and reads it back, which races when several
+        threads place orders at once. This is a copy of that method from
+        python-binance 1.0.19 (pinned in requirements.txt) that keeps the
+        response in a local variable; re-check it when bumping the pin. The rest of a request is safe to share: parameters
+        are a fresh dict per call, the HMAC template is only copied, and
+        the requests session is configured once here with a connection
+        pool larger than bot.orders.MAX_BATCH_WORKERS.
+
+        Returns:
+            dict or list: Decoded API response
+        """
+        kwargs = self.client._get_request_kwargs(method, signed, force_params, **kwargs)
+        response = getattr(self.client.session, method)(uri, **kwargs)
+        return self.client._handle_response(response)
+
     def get_futures_client(self):
         """
         Get the underlying futures client instance.
@@ -86,6 +188,148 @@ class BinanceClient:
         """
         return self.client
 
+    def get_symbol_filters(self, symbol, order_type):
+        """
+        Get the quantity step size and price tick size for a symbol.
+
+        MARKET orders use the MARKET_LOT_SIZE step, LIMIT orders LOT_SIZE.
+        The table comes from SYMBOL_FILTERS_FILE while it is younger than
+        SYMBOL_FILTERS_TTL. Only when the file is missing, stale, or lacks
+        the symbol is the full futures exchange info downloaded (one extra
+        round trip), after which the file is refreshed.
+
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            order_type: MARKET or LIMIT
+
+        Returns:
+            tuple: (step_size, tick_size) as Decimal
+
+        Raises:
+            ValueError: If the symbol is not listed on the exchange
+            BinanceAPIException: If API call fails
+            BinanceRequestException: If network error occurs
+        """
+        if self._symbol_filters is None:
+            self._symbol_filters = self._load_symbol_filters()
+            self._symbol_filters_from_disk = self._symbol_filters is not None
+
+        # A cached table may predate a new listing; refresh it once
+        if self._symbol_filters is None or (
+            symbol not in self._symbol_filters and self._symbol_filters_from_disk
+        ):
+            self._symbol_filters = self._fetch_symbol_filters()
+            self._symbol_filters_from_disk = False
+            self._save_symbol_filters(self._symbol_filters)
+
+        try:
+            lot_step, market_step, tick_size = self._symbol_filters[symbol]
+        except KeyError:
+            logger.warning("Symbol not found in exchange info: %s", symbol)
+            raise ValueError(f"Unknown futures symbol: {symbol}") from None
+
+        if order_type == 'MARKET':
+            return market_step, tick_size
+        return lot_step, tick_size
+
+    def _fetch_symbol_filters(self):
+        """
+        Download step and tick sizes for every symbol from exchange info.
+
+        Returns:
+            dict: symbol -> (LOT_SIZE step, MARKET_LOT_SIZE step, tickSize)
+        """
+        try:
+            logger.debug("Loading futures exchange info")
+            exchange_info = self.client.futures_exchange_info()
+        except BinanceAPIException as e:
+            logger.error("API error loading exchange info: %s - %s", e.status_code, e.message)
+            raise
+        except BinanceRequestException as e:
+            logger.error("Network error loading exchange info: %s", e)
+            raise
+
+        symbol_filters = {}
+        for info in exchange_info.get('symbols', []):
+            filters = {f['filterType']: f for f in info.get('filters', [])}
+            lot_step = filters.get('LOT_SIZE', {}).get('stepSize', '0')
+            symbol_filters[info['symbol']] = (
+                Decimal(lot_step),
+                Decimal(filters.get('MARKET_LOT_SIZE', {}).get('stepSize', lot_step)),
+                Decimal(filters.get('PRICE_FILTER', {}).get('tickSize', '0')),
+            )
+        return symbol_filters
+
+    def _load_symbol_filters(self):
+        """
+        Read the step/tick table from disk if it is fresh and for this URL.
+
+        Returns:
+            dict or None: Cached table, or None if unusable
+        """
+        try:
+            cached = json.loads(SYMBOL_FILTERS_FILE.read_text())
+            if cached['url'] != self.testnet_url:
+                return None
+            if time.time() - cached['fetched_at'] > SYMBOL_FILTERS_TTL:
+                return None
+            return {
+                symbol: tuple(Decimal(value) for value in values)
+                for symbol, values in cached['symbols'].items()
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, ArithmeticError) as e:
+            logger.warning("Ignoring unreadable symbol filter cache: %s", e)
+            return None
+
+    def _save_symbol_filters(self, symbol_filters):
+        """
+        Write the step/tick table to disk for later runs.
+
+        Failures are logged and ignored; the table is only an optimization.
+
+        Args:
+            symbol_filters: Table returned by _fetch_symbol_filters()
+        """
+        payload = {
+            'url': self.testnet_url,
+            'fetched_at': time.time(),
+            'symbols': {
+                symbol: [str(value) for value in values]
+                for symbol, values in symbol_filters.items()
+            },
+        }
+        try:
+            SYMBOL_FILTERS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = SYMBOL_FILTERS_FILE.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps(payload))
+            os.replace(tmp_file, SYMBOL_FILTERS_FILE)
+        except OSError as e:
+            logger.warning("Could not write symbol filter cache: %s", e)
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+
+        The python-binance client keeps a single requests session alive for
+        the lifetime of this wrapper, so every order reuses the same
+        TCP/TLS connection. Call this (or use the wrapper as a context
+        manager) once no more orders will be placed.
+
+        Only close clients you constructed yourself. The shared instance
+        from get_binance_client() is used by every caller in the process;
+        release it with close_binance_client() instead.
+        """
+        logger.debug("Closing Binance client session")
+        self.client.close_connection()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def place_market_order(self, symbol, side, quantity):
         """
         Place a market order on Binance Futures.
@@ -103,7 +347,7 @@ class BinanceClient:
             BinanceRequestException: If network error occurs
         """
         try:
-            logger.info(f"Placing MARKET order - Symbol: {symbol}, Side: {side}, Qty: {quantity}")
+            logger.info("Placing MARKET order - Symbol: %s, Side: %s, Qty: %s", symbol, side, quantity)
 
             # Place market order
             order = self.client.futures_create_order(
@@ -113,19 +357,19 @@ class BinanceClient:
                 quantity=quantity
             )
 
-            logger.info(f"Market order placed successfully. Order ID: {order.get('orderId')}")
-            logger.debug(f"Order response: {order}")
+            logger.info("Market order placed successfully. Order ID: %s", order.get('orderId'))
+            logger.debug("Order response: %s", order)
 
             return order
 
         except BinanceAPIException as e:
-            logger.error(f"API error placing market order: {e.status_code} - {e.message}")
+            logger.error("API error placing market order: %s - %s", e.status_code, e.message)
             raise
         except BinanceRequestException as e:
-            logger.error(f"Network error placing market order: {str(e)}")
+            logger.error("Network error placing market order: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error placing market order: {str(e)}")
+            logger.error("Unexpected error placing market order: %s", e)
             raise
 
     def place_limit_order(self, symbol, side, quantity, price):
@@ -147,8 +391,8 @@ class BinanceClient:
         """
         try:
             logger.info(
-                f"Placing LIMIT order - Symbol: {symbol}, Side: {side}, "
-                f"Qty: {quantity}, Price: {price}"
+                "Placing LIMIT order - Symbol: %s, Side: %s, Qty: %s, Price: %s",
+                symbol, side, quantity, price
             )
 
             # Place limit order
@@ -161,17 +405,69 @@ class BinanceClient:
                 price=price
             )
 
-            logger.info(f"Limit order placed successfully. Order ID: {order.get('orderId')}")
-            logger.debug(f"Order response: {order}")
+            logger.info("Limit order placed successfully. Order ID: %s", order.get('orderId'))
+            logger.debug("Order response: %s", order)
 
             return order
 
         except BinanceAPIException as e:
-            logger.error(f"API error placing limit order: {e.status_code} - {e.message}")
+            logger.error("API error placing limit order: %s - %s", e.status_code, e.message)
             raise
         except BinanceRequestException as e:
-            logger.error(f"Network error placing limit order: {str(e)}")
+            logger.error("Network error placing limit order: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error placing limit order: {str(e)}")
+            logger.error("Unexpected error placing limit order: %s", e)
             raise
+
+
+def _handle_response(response):
+    """
+    Parse a Binance REST response with orjson.
+
+    Mirrors python-binance's Client._handle_response, swapping the stdlib
+    JSON decoder for the faster orjson one.
+
+    Args:
+        response: requests.Response from the Binance API
+
+    Returns:
+        dict or list: Decoded JSON body
+
+    Raises:
+        BinanceAPIException: If the API returned a non-2xx status
+        BinanceRequestException: If the body is not valid JSON
+    """
+    if not (200 <= response.status_code < 300):
+        raise BinanceAPIException(response, response.status_code, response.text)
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise BinanceRequestException(f"Invalid Response: {response.text}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_binance_client():
+    """
+    Get the process-wide BinanceClient instance.
+
+    The client (and its pooled HTTP session) is created on first use and
+    reused by every later caller. Connection verification is left to the
+    caller so it runs at most once per process. Do not close it directly or
+    use it as a context manager; call close_binance_client() at shutdown.
+
+    Returns:
+        BinanceClient: Shared client instance
+    """
+    return BinanceClient(verify=False)
+
+
+def close_binance_client():
+    """
+    Close the process-wide client, if one was created, and forget it.
+
+    A later get_binance_client() call builds a fresh client.
+    """
+    if get_binance_client.cache_info().currsize:
+        get_binance_client().close()
+        get_binance_client.cache_clear()
@@ -1,9 +1,19 @@
 """Logging configuration for trading bot."""
 
+import atexit
 import logging
 import logging.handlers
+import queue
+import threading
 from pathlib import Path
 
+# Records are handed off to a background listener thread so that callers
+# on the order path only pay for an enqueue, not for file/console I/O
+_log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+_listener = None
+_listener_lock = threading.Lock()
+_atexit_registered = False
+
 
 def get_logger(name):
     """
@@ -24,22 +34,76 @@ def get_logger(name):
     return logger
 
 
+def stop_listener():
+    """
+    Flush pending log records and stop the background listener thread.
+
+    The file and console handlers are closed. Loggers keep their queue
+    handlers, and the next record they emit starts a fresh listener, so
+    nothing is left queued without a consumer.
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+class _ListenerQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that (re)starts the listener before enqueuing."""
+
+    def enqueue(self, record):
+        if _listener is None:
+            _start_listener()
+        super().enqueue(record)
+
+
 def _configure_logging(logger):
     """
-    Configure logging with file and console handlers.
+    Attach the shared queue handler to a logger.
 
     Args:
         logger: Logger instance to configure
     """
+    _start_listener()
+
+    # Set logger level
+    logger.setLevel(logging.DEBUG)
+
+    logger.addHandler(_ListenerQueueHandler(_log_queue))
+
+
+def _start_listener():
+    """Create the file and console handlers and start the queue listener if stopped."""
+    global _listener, _atexit_registered
+
+    with _listener_lock:
+        if _listener is None:
+            _listener = _create_listener()
+            _listener.start()
+
+        # Drain the queue before the interpreter exits
+        if not _atexit_registered:
+            atexit.register(stop_listener)
+            _atexit_registered = True
+
+
+def _create_listener():
+    """
+    Build the file and console handlers behind a queue listener.
+
+    Returns:
+        logging.handlers.QueueListener: Listener that is not yet started
+    """
     # Create logs directory if it doesn't exist
     logs_dir = Path(__file__).parent.parent / "logs"
     logs_dir.mkdir(exist_ok=True)
 
     log_file = logs_dir / "trading_bot.log"
 
-    # Set logger level
-    logger.setLevel(logging.DEBUG)
-
     # Log format
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -54,10 +118,15 @@ def _configure_logging(logger):
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler for INFO level
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    return logging.handlers.QueueListener(
+        _log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
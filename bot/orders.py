@@ -1,25 +1,78 @@
 """Order service for trading bot."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
+
 from bot.logging_config import get_logger
-from bot.validators import validate_all_inputs
+from bot.validators import (
+    ValidatedOrder,
+    quantize_price,
+    quantize_quantity,
+    validate_all_inputs,
+)
 
 logger = get_logger(__name__)
 
+# (validated order, quantity, price) ready to send, see OrderService._prepare
+PreparedOrder = tuple[ValidatedOrder, str, str | None]
+
+# Upper bound on concurrent order submissions in place_orders
+MAX_BATCH_WORKERS = 16
+
+# (normalized key, Binance response key) pairs for extract_order_details
+_ORDER_KEYS = (
+    ('orderId', 'orderId'),
+    ('symbol', 'symbol'),
+    ('side', 'side'),
+    ('type', 'type'),
+    ('origQty', 'origQty'),
+    ('price', 'price'),
+    ('status', 'status'),
+    ('executedQty', 'executedQty'),
+    ('avgPrice', 'avgPrice'),
+    ('timestamp', 'updateTime'),
+)
+
+
+class BatchOrderError(Exception):
+    """Raised when one or more orders in a batch fail to submit."""
+
+    def __init__(self, message: str, results: list[Any]) -> None:
+        """
+        Initialize with the outcome of every order in the batch.
+
+        Args:
+            message: Error summary
+            results: One entry per input order, in input order: the
+                     standardized order response if it was placed, or the
+                     exception raised while submitting it
+        """
+        super().__init__(message)
+        self.results = results
+
 
 class OrderService:
     """Service layer for order placement."""
 
-    def __init__(self, binance_client):
+    def __init__(self, binance_client: Any) -> None:
         """
         Initialize order service with a Binance client.
 
         Args:
             binance_client: BinanceClient instance
         """
-        self.client = binance_client
+        self.client: Any = binance_client
         logger.info("OrderService initialized")
 
-    def place_order(self, symbol, side, order_type, quantity, price=None):
+    def place_order(
+        self,
+        symbol: Any,
+        side: Any,
+        order_type: Any,
+        quantity: Any,
+        price: Any = None
+    ) -> dict[str, Any]:
         """
         Place an order with validation and error handling.
 
@@ -32,7 +85,8 @@ class OrderService:
 
         Returns:
             dict: Standardized order response with keys:
-                  orderId, symbol, side, type, status, executedQty, avgPrice, timestamp
+                  orderId, symbol, side, type, origQty, price, status,
+                  executedQty, avgPrice, timestamp
 
         Raises:
             ValueError: If validation fails
@@ -43,66 +97,165 @@ class OrderService:
             # Validate all inputs
             validated = validate_all_inputs(symbol, side, order_type, quantity, price)
 
-            # Log order request summary
-            summary = format_order_summary(validated)
-            logger.info(f"Order request: {summary}")
+            return self._submit(self._prepare(validated))
 
-            # Place order through client
-            if validated['order_type'] == 'MARKET':
-                response = self.client.place_market_order(
-                    validated['symbol'],
-                    validated['side'],
-                    validated['quantity']
-                )
-            else:  # LIMIT
-                response = self.client.place_limit_order(
-                    validated['symbol'],
-                    validated['side'],
-                    validated['quantity'],
-                    validated['price']
-                )
+        except ValueError as e:
+            logger.error("Validation error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Order placement failed: %s", e)
+            raise
+
+    def place_orders(self, orders: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Validate a batch of orders, then submit them concurrently.
+
+        Every order is validated before any is sent, so an invalid entry
+        rejects the whole batch without placing anything. Submissions then
+        run in parallel over the client's pooled connection, so the batch
+        takes roughly as long as the slowest order rather than the sum.
+
+        Args:
+            orders: Iterable of dicts with keys symbol, side, order_type,
+                    quantity and optionally price (same as place_order)
 
-            # Extract and normalize response
-            order_details = extract_order_details(response)
+        Returns:
+            list: Standardized order responses, in the same order as input
 
-            # Log formatted response
-            response_summary = format_order_response(order_details)
-            logger.info(f"Order response: {response_summary}")
+        Raises:
+            ValueError: If validation fails for any order
+            BatchOrderError: If any submission fails; its ``results`` holds
+                             the response or exception for every order,
+                             so orders that were placed are still reported
+        """
+        try:
+            validated_orders = [validate_all_inputs(**order) for order in orders]
+            prepared_orders = [self._prepare(validated) for validated in validated_orders]
+            if not prepared_orders:
+                return []
+
+            # Safe to share one client across threads, see BinanceClient._request
+            workers = min(len(prepared_orders), MAX_BATCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._submit, prepared) for prepared in prepared_orders]
 
-            return order_details
+            # Collect every outcome so orders that did go through are never lost
+            results: list[Any] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+
+            failed = sum(isinstance(result, Exception) for result in results)
+            if failed:
+                raise BatchOrderError(
+                    f"{failed} of {len(results)} orders failed to submit", results
+                )
+
+            return results
 
         except ValueError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Order placement failed: {str(e)}")
+            logger.error("Batch order placement failed: %s", e)
             raise
 
+    def _prepare(self, validated: ValidatedOrder) -> PreparedOrder:
+        """
+        Round quantity and price to the symbol's exchange filters.
+
+        Sending values that already match the step and tick sizes avoids
+        the exchange rejecting the order and forcing a retry.
+
+        Args:
+            validated: ValidatedOrder from validate_all_inputs
+
+        Returns:
+            tuple: (validated, quantity, price) with quantity and price as
+                   decimal strings (price is None for MARKET orders)
+
+        Raises:
+            ValueError: If the symbol is unknown or values round to zero
+        """
+        step_size, tick_size = self.client.get_symbol_filters(
+            validated.symbol, validated.order_type
+        )
 
-def format_order_summary(order_params):
+        quantity = quantize_quantity(validated.quantity, step_size)
+        price = None
+        if validated.price is not None:
+            price = quantize_price(validated.price, tick_size, validated.side)
+
+        return validated, quantity, price
+
+    def _submit(self, prepared: PreparedOrder) -> dict[str, Any]:
+        """
+        Send one prepared order and normalize the response.
+
+        Args:
+            prepared: (validated, quantity, price) tuple from _prepare
+
+        Returns:
+            dict: Standardized order response
+        """
+        validated, quantity, price = prepared
+
+        # Log order request summary
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Order request: %s", format_order_summary(prepared))
+
+        # Place order through client
+        if validated.order_type == 'MARKET':
+            response = self.client.place_market_order(
+                validated.symbol,
+                validated.side,
+                quantity
+            )
+        else:  # LIMIT
+            response = self.client.place_limit_order(
+                validated.symbol,
+                validated.side,
+                quantity,
+                price
+            )
+
+        # Extract and normalize response
+        order_details = extract_order_details(response)
+
+        # Log formatted response
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Order response: %s", format_order_response(order_details))
+
+        return order_details
+
+
+def format_order_summary(prepared: PreparedOrder) -> str:
     """
     Format order parameters for logging.
 
     Args:
-        order_params: Dictionary with order parameters
+        prepared: (validated, quantity, price) tuple as sent to the exchange
 
     Returns:
         str: Formatted order summary
     """
+    order, quantity, price = prepared
     summary = (
-        f"Symbol={order_params['symbol']}, "
-        f"Side={order_params['side']}, "
-        f"Type={order_params['order_type']}, "
-        f"Quantity={order_params['quantity']}"
+        f"Symbol={order.symbol}, "
+        f"Side={order.side}, "
+        f"Type={order.order_type}, "
+        f"Quantity={quantity}"
     )
 
-    if order_params.get('price') is not None:
-        summary += f", Price={order_params['price']}"
+    if price is not None:
+        summary += f", Price={price}"
 
     return summary
 
 
-def format_order_response(order_details):
+def format_order_response(order_details: dict[str, Any]) -> str:
     """
     Format order response for logging.
 
@@ -113,18 +266,13 @@ def format_order_response(order_details):
         str: Formatted order response
     """
     return (
-        f"OrderID={order_details.get('orderId')}, "
-        f"Symbol={order_details.get('symbol')}, "
-        f"Side={order_details.get('side')}, "
-        f"Type={order_details.get('type')}, "
-        f"Status={order_details.get('status')}, "
-        f"ExecutedQty={order_details.get('executedQty')}, "
-        f"AvgPrice={order_details.get('avgPrice')}, "
-        f"Timestamp={order_details.get('timestamp')}"
-    )
+        "OrderID={orderId}, Symbol={symbol}, Side={side}, Type={type}, "
+        "OrigQty={origQty}, Price={price}, Status={status}, ExecutedQty={executedQty}, AvgPrice={avgPrice}, "
+        "Timestamp={timestamp}"
+    ).format_map(order_details)
 
 
-def extract_order_details(response):
+def extract_order_details(response: dict[str, Any]) -> dict[str, Any]:
     """
     Extract and normalize order details from API response.
 
@@ -134,13 +282,4 @@ def extract_order_details(response):
     Returns:
         dict: Standardized order details
     """
-    return {
-        'orderId': response.get('orderId'),
-        'symbol': response.get('symbol'),
-        'side': response.get('side'),
-        'type': response.get('type'),
-        'status': response.get('status'),
-        'executedQty': response.get('executedQty'),
-        'avgPrice': response.get('avgPrice'),
-        'timestamp': response.get('updateTime'),
-    }
+    return {key: response.get(source) for key, source in _ORDER_KEYS}
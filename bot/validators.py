@@ -1,15 +1,50 @@
 """Input validation for trading bot."""
 
-import re
+import functools
+import math
+import sys
+from dataclasses import asdict, dataclass
+from decimal import ROUND_DOWN, ROUND_UP, Decimal, InvalidOperation
+from typing import Any
+
 from bot.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_SIDES = frozenset({'BUY', 'SELL'})
+_ORDER_TYPES = frozenset({'MARKET', 'LIMIT'})
+
+# Max distinct raw symbol inputs remembered by _normalize_symbol
+SYMBOL_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class ValidatedOrder:
+    """Validated and normalized order parameters."""
+
+    symbol: str
+    side: str
+    order_type: str
+    quantity: float
+    price: float | None = None
 
-def validate_symbol(symbol):
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Convert to a plain dictionary.
+
+        Returns:
+            dict: Order parameters keyed by field name
+        """
+        return asdict(self)
+
+
+def validate_symbol(symbol: Any) -> str:
     """
     Validate and normalize trading symbol.
 
+    Recently validated inputs are returned from a bounded LRU cache
+    without repeating the checks.
+
     Args:
         symbol: Trading pair symbol (e.g., BTCUSDT)
 
@@ -20,25 +55,31 @@ def validate_symbol(symbol):
         ValueError: If symbol is invalid
     """
     if not symbol or not isinstance(symbol, str):
-        logger.warning(f"Invalid symbol type: {type(symbol)}")
+        logger.warning("Invalid symbol type: %s", type(symbol))
         raise ValueError("Symbol must be a non-empty string")
 
+    return _normalize_symbol(symbol)
+
+
+@functools.lru_cache(maxsize=SYMBOL_CACHE_SIZE)
+def _normalize_symbol(symbol: str) -> str:
+    """Uppercase and check a symbol string; results are cached, errors are not."""
     symbol = symbol.upper().strip()
 
     # Check if symbol is alphanumeric
-    if not re.match(r'^[A-Z0-9]+$', symbol):
-        logger.warning(f"Invalid symbol format: {symbol}")
+    if not (symbol.isascii() and symbol.isalnum()):
+        logger.warning("Invalid symbol format: %s", symbol)
         raise ValueError(f"Symbol must contain only alphanumeric characters, got: {symbol}")
 
     if len(symbol) < 2:
-        logger.warning(f"Symbol too short: {symbol}")
+        logger.warning("Symbol too short: %s", symbol)
         raise ValueError(f"Symbol must be at least 2 characters, got: {len(symbol)}")
 
-    logger.debug(f"Symbol validated: {symbol}")
-    return symbol
+    logger.debug("Symbol validated: %s", symbol)
+    return sys.intern(symbol)
 
 
-def validate_side(side):
+def validate_side(side: Any) -> str:
     """
     Validate order side (BUY or SELL).
 
@@ -52,20 +93,20 @@ def validate_side(side):
         ValueError: If side is invalid
     """
     if not side or not isinstance(side, str):
-        logger.warning(f"Invalid side type: {type(side)}")
+        logger.warning("Invalid side type: %s", type(side))
         raise ValueError("Side must be a non-empty string")
 
     side = side.upper().strip()
 
-    if side not in ('BUY', 'SELL'):
-        logger.warning(f"Invalid side value: {side}")
+    if side not in _SIDES:
+        logger.warning("Invalid side value: %s", side)
         raise ValueError(f"Side must be 'BUY' or 'SELL', got: {side}")
 
-    logger.debug(f"Side validated: {side}")
+    logger.debug("Side validated: %s", side)
     return side
 
 
-def validate_order_type(order_type):
+def validate_order_type(order_type: Any) -> str:
     """
     Validate order type (MARKET or LIMIT).
 
@@ -79,20 +120,20 @@ def validate_order_type(order_type):
         ValueError: If order type is invalid
     """
     if not order_type or not isinstance(order_type, str):
-        logger.warning(f"Invalid order_type type: {type(order_type)}")
+        logger.warning("Invalid order_type type: %s", type(order_type))
         raise ValueError("Order type must be a non-empty string")
 
     order_type = order_type.upper().strip()
 
-    if order_type not in ('MARKET', 'LIMIT'):
-        logger.warning(f"Invalid order_type value: {order_type}")
+    if order_type not in _ORDER_TYPES:
+        logger.warning("Invalid order_type value: %s", order_type)
         raise ValueError(f"Order type must be 'MARKET' or 'LIMIT', got: {order_type}")
 
-    logger.debug(f"Order type validated: {order_type}")
+    logger.debug("Order type validated: %s", order_type)
     return order_type
 
 
-def validate_quantity(quantity):
+def validate_quantity(quantity: Any) -> float:
     """
     Validate order quantity as positive decimal number.
 
@@ -108,18 +149,22 @@ def validate_quantity(quantity):
     try:
         qty = float(quantity)
     except (TypeError, ValueError):
-        logger.warning(f"Invalid quantity format: {quantity}")
+        logger.warning("Invalid quantity format: %s", quantity)
         raise ValueError(f"Quantity must be a valid number, got: {quantity}")
 
+    if not math.isfinite(qty):
+        logger.warning("Non-finite quantity: %s", quantity)
+        raise ValueError(f"Quantity must be a finite number, got: {quantity}")
+
     if qty <= 0:
-        logger.warning(f"Invalid quantity value: {qty}")
+        logger.warning("Invalid quantity value: %s", qty)
         raise ValueError(f"Quantity must be positive, got: {qty}")
 
-    logger.debug(f"Quantity validated: {qty}")
+    logger.debug("Quantity validated: %s", qty)
     return qty
 
 
-def validate_price(price, order_type):
+def validate_price(price: Any, order_type: str) -> float | None:
     """
     Validate order price (required for LIMIT orders, positive decimal).
 
@@ -141,22 +186,124 @@ def validate_price(price, order_type):
         try:
             px = float(price)
         except (TypeError, ValueError):
-            logger.warning(f"Invalid price format: {price}")
+            logger.warning("Invalid price format: %s", price)
             raise ValueError(f"Price must be a valid number, got: {price}")
 
+        if not math.isfinite(px):
+            logger.warning("Non-finite price: %s", price)
+            raise ValueError(f"Price must be a finite number, got: {price}")
+
         if px <= 0:
-            logger.warning(f"Invalid price value: {px}")
+            logger.warning("Invalid price value: %s", px)
             raise ValueError(f"Price must be positive, got: {px}")
 
-        logger.debug(f"Price validated: {px}")
+        logger.debug("Price validated: %s", px)
         return px
     else:  # MARKET order
         if price is not None:
-            logger.warning(f"Price not required for MARKET orders, ignoring: {price}")
+            logger.warning("Price not required for MARKET orders, ignoring: %s", price)
         return None
 
 
-def validate_all_inputs(symbol, side, order_type, quantity, price=None):
+def quantize_quantity(quantity: float, step_size: Decimal) -> str:
+    """
+    Round a quantity down to the symbol's step size.
+
+    Rounding down never sends a larger order than requested. Any
+    adjustment is logged as a warning.
+
+    Args:
+        quantity: Validated order quantity
+        step_size: Symbol lot size step (Decimal, 0 disables rounding)
+
+    Returns:
+        str: Quantity as a plain decimal string
+
+    Raises:
+        ValueError: If the quantity rounds down to zero
+    """
+    qty = _quantize(quantity, step_size, ROUND_DOWN)
+
+    if qty <= 0:
+        logger.warning("Quantity below step size: %s < %s", quantity, step_size)
+        raise ValueError(
+            f"Quantity must be at least the step size {format(step_size.normalize(), 'f')}, "
+            f"got: {quantity}"
+        )
+
+    quantized = format(qty.normalize(), 'f')
+    if qty != Decimal(str(quantity)):
+        logger.warning(
+            "Quantity %s rounded down to step size %s: sending %s",
+            quantity, format(step_size.normalize(), 'f'), quantized
+        )
+    logger.debug("Quantity quantized: %s", quantized)
+    return quantized
+
+
+def quantize_price(price: float, tick_size: Decimal, side: str) -> str:
+    """
+    Round a price to the symbol's tick size in the user's favour.
+
+    BUY prices are rounded down and SELL prices up, so the order is never
+    sent at a worse price than requested. Any adjustment is logged as a
+    warning.
+
+    Args:
+        price: Validated order price
+        tick_size: Symbol PRICE_FILTER tick (Decimal, 0 disables rounding)
+        side: Validated order side (BUY or SELL)
+
+    Returns:
+        str: Price as a plain decimal string
+
+    Raises:
+        ValueError: If the price rounds to zero
+    """
+    rounding = ROUND_DOWN if side == 'BUY' else ROUND_UP
+    px = _quantize(price, tick_size, rounding)
+
+    if px <= 0:
+        logger.warning("Price below tick size: %s < %s", price, tick_size)
+        raise ValueError(
+            f"Price must be at least the tick size {format(tick_size.normalize(), 'f')}, "
+            f"got: {price}"
+        )
+
+    quantized = format(px.normalize(), 'f')
+    if px != Decimal(str(price)):
+        logger.warning(
+            "%s price %s rounded %s to tick size %s: sending %s",
+            side, price, 'down' if side == 'BUY' else 'up',
+            format(tick_size.normalize(), 'f'), quantized
+        )
+    logger.debug("Price quantized: %s", quantized)
+    return quantized
+
+
+def _quantize(value: float, step: Decimal, rounding: str) -> Decimal:
+    """Round value to a multiple of step, going through str to avoid float noise."""
+    exact = Decimal(str(value))
+    if not exact.is_finite():
+        raise ValueError(f"Value must be a finite number, got: {value}")
+    if step <= 0:
+        return exact
+    try:
+        return (exact / step).quantize(Decimal(1), rounding=rounding) * step
+    except InvalidOperation:
+        logger.warning("Value out of range for step size: %s / %s", value, step)
+        raise ValueError(
+            f"Value {value} is too large for step size {format(step.normalize(), 'f')}"
+        ) from None
+
+
+def validate_all_inputs(
+    symbol: Any,
+    side: Any,
+    order_type: Any,
+    quantity: Any,
+    price: Any = None
+) -> ValidatedOrder:
     """
     Validate all inputs together.
 
@@ -168,26 +315,28 @@ def validate_all_inputs(symbol, side, order_type, quantity, price=None):
         price: Order price (optional, required for LIMIT)
 
     Returns:
-        dict: Dictionary with validated and normalized values
+        ValidatedOrder: Validated and normalized values
 
     Raises:
         ValueError: If any input is invalid
     """
-    logger.info(f"Validating inputs - Symbol: {symbol}, Side: {side}, Type: {order_type}, Qty: {quantity}, Price: {price}")
+    logger.info(
+        "Validating inputs - Symbol: %s, Side: %s, Type: %s, Qty: %s, Price: %s",
+        symbol, side, order_type, quantity, price
+    )
 
     try:
-        validated = {
-            'symbol': validate_symbol(symbol),
-            'side': validate_side(side),
-            'order_type': validate_order_type(order_type),
-            'quantity': validate_quantity(quantity),
-        }
+        symbol = validate_symbol(symbol)
+        side = validate_side(side)
+        order_type = validate_order_type(order_type)
+        quantity = validate_quantity(quantity)
+        price = validate_price(price, order_type)
 
-        validated['price'] = validate_price(price, validated['order_type'])
+        validated = ValidatedOrder(symbol, side, order_type, quantity, price)
 
         logger.info("All inputs validated successfully")
         return validated
 
     except ValueError as e:
-        logger.error(f"Validation failed: {str(e)}")
+        logger.error("Validation failed: %s", e)
         raise
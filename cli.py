@@ -1,90 +1,151 @@
 """CLI interface for trading bot."""
 
+import argparse
 import sys
-import click
 
 from bot.logging_config import get_logger
-from bot.client import BinanceClient
-from bot.orders import OrderService
 
 logger = get_logger(__name__)
 
+ANSI = {
+    'red': '\033[31m',
+    'green': '\033[32m',
+    'yellow': '\033[33m',
+    'cyan': '\033[36m',
+    'bold': '\033[1m',
+    'reset': '\033[0m',
+}
 
-@click.command()
-@click.option(
-    '--symbol',
-    required=True,
-    help='Trading pair (e.g., BTCUSDT)'
-)
-@click.option(
-    '--side',
-    required=True,
-    type=click.Choice(['BUY', 'SELL'], case_sensitive=False),
-    help='Order side: BUY or SELL'
-)
-@click.option(
-    '--type',
-    'order_type',
-    required=True,
-    type=click.Choice(['MARKET', 'LIMIT'], case_sensitive=False),
-    help='Order type: MARKET or LIMIT'
-)
-@click.option(
-    '--quantity',
-    required=True,
-    type=float,
-    help='Order quantity'
-)
-@click.option(
-    '--price',
-    type=float,
-    default=None,
-    help='Price (required for LIMIT orders)'
-)
-def main(symbol, side, order_type, quantity, price):
+EXAMPLES = """\
+Examples:
+
+Market order:
+  python cli.py --symbol BTCUSDT --side BUY --type MARKET --quantity 0.001
+
+Limit order:
+  python cli.py --symbol ETHUSDT --side SELL --type LIMIT --quantity 0.01 --price 3500.50
+"""
+
+
+def style(text, fg, bold=False):
     """
-    Place an order on Binance Futures Testnet.
+    Wrap text in ANSI color codes when writing to a terminal.
+
+    Args:
+        text: Text to style
+        fg: Foreground color name (key of ANSI)
+        bold: Render text in bold
+
+    Returns:
+        str: Styled text, or the text unchanged if stdout is not a TTY
+    """
+    if not sys.stdout.isatty():
+        return text
+
+    prefix = ANSI[fg] + (ANSI['bold'] if bold else '')
+    return f"{prefix}{text}{ANSI['reset']}"
 
-    Examples:
 
-    Market order:
-    \b
-    python cli.py --symbol BTCUSDT --side BUY --type MARKET --quantity 0.001
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
 
-    Limit order:
-    \b
-    python cli.py --symbol ETHUSDT --side SELL --type LIMIT --quantity 0.01 --price 3500.50
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Place an order on Binance Futures Testnet.',
+        epilog=EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        '--symbol',
+        required=True,
+        help='Trading pair (e.g., BTCUSDT)'
+    )
+    parser.add_argument(
+        '--side',
+        required=True,
+        type=str.upper,
+        choices=['BUY', 'SELL'],
+        help='Order side: BUY or SELL'
+    )
+    parser.add_argument(
+        '--type',
+        dest='order_type',
+        required=True,
+        type=str.upper,
+        choices=['MARKET', 'LIMIT'],
+        help='Order type: MARKET or LIMIT'
+    )
+    parser.add_argument(
+        '--quantity',
+        required=True,
+        type=float,
+        help='Order quantity'
+    )
+    parser.add_argument(
+        '--price',
+        type=float,
+        default=None,
+        help='Price (required for LIMIT orders)'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
+    Place an order on Binance Futures Testnet.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    args = parse_args(argv)
+    symbol = args.symbol
+    side = args.side
+    order_type = args.order_type
+    quantity = args.quantity
+    price = args.price
+    client = None
+
     try:
         # Initialize logging
-        click.echo(click.style("=" * 60, fg='cyan'))
-        click.echo(click.style("ORDER REQUEST", fg='cyan', bold=True))
-        click.echo(click.style("=" * 60, fg='cyan'))
+        print(style("=" * 60, 'cyan'))
+        print(style("ORDER REQUEST", 'cyan', bold=True))
+        print(style("=" * 60, 'cyan'))
 
         # Display request parameters
-        click.echo(f"Symbol:   {symbol}")
-        click.echo(f"Side:     {side}")
-        click.echo(f"Type:     {order_type}")
-        click.echo(f"Quantity: {quantity}")
+        print(f"Symbol:   {symbol}")
+        print(f"Side:     {side}")
+        print(f"Type:     {order_type}")
+        print(f"Quantity: {quantity}")
         if price is not None:
-            click.echo(f"Price:    {price}")
-        click.echo()
+            print(f"Price:    {price}")
+        print()
 
         logger.info("=" * 60)
         logger.info("CLI order placement initiated")
         logger.info(f"Symbol: {symbol}, Side: {side}, Type: {order_type}, Qty: {quantity}, Price: {price}")
 
+        # Deferred so --help and argument errors don't pay for importing binance
+        from bot.client import close_binance_client, get_binance_client
+        from bot.orders import OrderService
+
         # Initialize Binance client
-        click.echo(click.style("Connecting to Binance Futures Testnet...", fg='yellow'))
-        client = BinanceClient()
-        click.echo(click.style("✓ Connected to Binance Futures Testnet", fg='green'))
-        click.echo()
+        print(style("Connecting to Binance Futures Testnet...", 'yellow'))
+        client = get_binance_client()
+        client.test_connection()
+        print(style("✓ Connected to Binance Futures Testnet", 'green'))
+        print()
 
         # Initialize order service
         service = OrderService(client)
 
         # Place order
-        click.echo(click.style("Placing order...", fg='yellow'))
+        print(style("Placing order...", 'yellow'))
         response = service.place_order(
             symbol=symbol,
             side=side,
@@ -94,39 +155,42 @@ def main(symbol, side, order_type, quantity, price):
         )
 
         # Display response
-        click.echo()
-        click.echo(click.style("=" * 60, fg='cyan'))
-        click.echo(click.style("ORDER RESPONSE", fg='cyan', bold=True))
-        click.echo(click.style("=" * 60, fg='cyan'))
-
-        click.echo(f"Order ID:       {response.get('orderId')}")
-        click.echo(f"Symbol:         {response.get('symbol')}")
-        click.echo(f"Side:           {response.get('side')}")
-        click.echo(f"Type:           {response.get('type')}")
-        click.echo(f"Status:         {response.get('status')}")
-        click.echo(f"Executed Qty:   {response.get('executedQty')}")
-        click.echo(f"Avg Price:      {response.get('avgPrice')}")
-        click.echo(f"Timestamp:      {response.get('timestamp')}")
-        click.echo()
+        print()
+        print(style("=" * 60, 'cyan'))
+        print(style("ORDER RESPONSE", 'cyan', bold=True))
+        print(style("=" * 60, 'cyan'))
+
+        print(f"Order ID:       {response.get('orderId')}")
+        print(f"Symbol:         {response.get('symbol')}")
+        print(f"Side:           {response.get('side')}")
+        print(f"Type:           {response.get('type')}")
+        print(f"Quantity:       {response.get('origQty')}")
+        if response.get('type') == 'LIMIT':
+            print(f"Price:          {response.get('price')}")
+        print(f"Status:         {response.get('status')}")
+        print(f"Executed Qty:   {response.get('executedQty')}")
+        print(f"Avg Price:      {response.get('avgPrice')}")
+        print(f"Timestamp:      {response.get('timestamp')}")
+        print()
 
         # Display result
-        click.echo(click.style("=" * 60, fg='cyan'))
-        click.echo(click.style("RESULT", fg='cyan', bold=True))
-        click.echo(click.style("=" * 60, fg='cyan'))
-        click.echo(click.style("✓ Order placed successfully!", fg='green', bold=True))
-        click.echo()
+        print(style("=" * 60, 'cyan'))
+        print(style("RESULT", 'cyan', bold=True))
+        print(style("=" * 60, 'cyan'))
+        print(style("✓ Order placed successfully!", 'green', bold=True))
+        print()
 
         logger.info("Order placement completed successfully")
         sys.exit(0)
 
     except ValueError as e:
         # Validation errors
-        click.echo()
-        click.echo(click.style("=" * 60, fg='red'))
-        click.echo(click.style("VALIDATION ERROR", fg='red', bold=True))
-        click.echo(click.style("=" * 60, fg='red'))
-        click.echo(click.style(f"✗ {str(e)}", fg='red'))
-        click.echo()
+        print()
+        print(style("=" * 60, 'red'))
+        print(style("VALIDATION ERROR", 'red', bold=True))
+        print(style("=" * 60, 'red'))
+        print(style(f"✗ {str(e)}", 'red'))
+        print()
 
         logger.error(f"Validation error: {str(e)}")
         sys.exit(1)
@@ -141,18 +205,23 @@ def main(symbol, side, order_type, quantity, price):
         elif hasattr(e, 'status_code'):
             error_message = f"API Error {e.status_code}: {str(e)}"
 
-        click.echo()
-        click.echo(click.style("=" * 60, fg='red'))
-        click.echo(click.style("ERROR", fg='red', bold=True))
-        click.echo(click.style("=" * 60, fg='red'))
-        click.echo(click.style(f"✗ {error_message}", fg='red'))
-        click.echo()
-        click.echo(click.style("Check logs/trading_bot.log for details", fg='yellow'))
-        click.echo()
+        print()
+        print(style("=" * 60, 'red'))
+        print(style("ERROR", 'red', bold=True))
+        print(style("=" * 60, 'red'))
+        print(style(f"✗ {error_message}", 'red'))
+        print()
+        print(style("Check logs/trading_bot.log for details", 'yellow'))
+        print()
 
         logger.error(f"Order placement failed: {error_message}", exc_info=True)
         sys.exit(1)
 
+    finally:
+        # Release the shared client's pooled connections before exiting
+        if client is not None:
+            close_binance_client()
+
 
 if __name__ == '__main__':
     main()
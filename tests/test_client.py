@@ -0,0 +1,178 @@
+"""Tests for BinanceClient request handling."""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import pytest
+
+pytest.importorskip("binance")
+
+from binance.client import Client  # noqa: E402
+
+from bot import client as client_module  # noqa: E402
+from bot.client import BinanceClient  # noqa: E402
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, body):
+        self.status_code = 200
+        self.text = body
+        self.content = body.encode()
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    """Echoes the posted symbol back after a delay, to interleave threads."""
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, uri, **kwargs):
+        params = dict(kwargs['data'])
+        self.calls.append((uri, kwargs['data']))
+        time.sleep(0.01 * int(params['delay']))
+        return FakeResponse(json.dumps({'symbol': params['symbol']}))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def binance_client(monkeypatch, tmp_path):
+    monkeypatch.setattr(Client, 'ping', lambda self: {})
+    monkeypatch.setattr(client_module, '_API_KEY', 'key')
+    monkeypatch.setattr(client_module, '_API_SECRET', 'secret')
+    monkeypatch.setattr(
+        client_module, 'SYMBOL_FILTERS_FILE', tmp_path / 'symbol_filters.json'
+    )
+
+    wrapper = BinanceClient(verify=False)
+    wrapper.client.session = FakeSession()
+    return wrapper
+
+
+def test_request_signs_with_cached_hmac(binance_client):
+    binance_client.client._request(
+        'post', 'https://example/order', True,
+        data={'symbol': 'BTCUSDT', 'delay': 0}
+    )
+
+    _, data = binance_client.client.session.calls[0]
+    params = [(key, value) for key, value in data if key != 'signature']
+    expected = hmac.new(b'secret', urlencode(params).encode(), hashlib.sha256).hexdigest()
+    assert data[-1] == ('signature', expected)
+
+
+def test_request_keeps_response_off_shared_client(binance_client):
+    # The stock Client._request parks each reply on client.response, which
+    # another thread can overwrite before it is read back
+    result = binance_client.client._request(
+        'post', 'https://example/order', True,
+        data={'symbol': 'BTCUSDT', 'delay': 0}
+    )
+
+    assert result == {'symbol': 'BTCUSDT'}
+    assert binance_client.client.response is None
+
+
+def test_concurrent_requests_get_their_own_response(binance_client):
+    symbols = [f'SYM{i}' for i in range(8)]
+    results = {}
+
+    def place(index, symbol):
+        # Earlier threads wait longest, so responses complete out of order
+        results[symbol] = binance_client.client._request(
+            'post', 'https://example/order', True,
+            data={'symbol': symbol, 'delay': len(symbols) - index}
+        )
+
+    threads = [threading.Thread(target=place, args=item) for item in enumerate(symbols)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {symbol: {'symbol': symbol} for symbol in symbols}
+
+
+EXCHANGE_INFO = {
+    'symbols': [{
+        'symbol': 'BTCUSDT',
+        'filters': [
+            {'filterType': 'LOT_SIZE', 'stepSize': '0.001'},
+            {'filterType': 'MARKET_LOT_SIZE', 'stepSize': '0.01'},
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.10'},
+        ],
+    }],
+}
+
+
+def new_client(calls):
+    """Client whose exchange info download is counted in calls."""
+    wrapper = BinanceClient(verify=False)
+    wrapper.client.session = FakeSession()
+
+    def futures_exchange_info():
+        calls.append(1)
+        return EXCHANGE_INFO
+
+    wrapper.client.futures_exchange_info = futures_exchange_info
+    return wrapper
+
+
+def test_symbol_filters_are_reused_from_disk(binance_client):
+    calls = []
+    assert new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT') == (
+        Decimal('0.001'), Decimal('0.10')
+    )
+    assert new_client(calls).get_symbol_filters('BTCUSDT', 'MARKET') == (
+        Decimal('0.01'), Decimal('0.10')
+    )
+    assert len(calls) == 1
+
+
+def test_stale_symbol_filter_cache_is_refetched(binance_client, monkeypatch):
+    calls = []
+    new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')
+    monkeypatch.setattr(client_module, 'SYMBOL_FILTERS_TTL', -1)
+
+    new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')
+    assert len(calls) == 2
+
+
+def test_symbol_filter_cache_is_per_url(binance_client, monkeypatch):
+    calls = []
+    new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')
+    monkeypatch.setattr(client_module, '_TESTNET_URL', 'https://other.example')
+
+    new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')
+    assert len(calls) == 2
+
+
+def test_unknown_symbol_refetches_cached_table_once(binance_client):
+    calls = []
+    new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')
+
+    wrapper = new_client(calls)
+    with pytest.raises(ValueError, match='Unknown futures symbol'):
+        wrapper.get_symbol_filters('NEWUSDT', 'LIMIT')
+    with pytest.raises(ValueError, match='Unknown futures symbol'):
+        wrapper.get_symbol_filters('NEWUSDT', 'LIMIT')
+    assert len(calls) == 2
+
+
+def test_unreadable_symbol_filter_cache_is_ignored(binance_client):
+    client_module.SYMBOL_FILTERS_FILE.write_text('not json')
+    calls = []
+
+    assert new_client(calls).get_symbol_filters('BTCUSDT', 'LIMIT')[0] == Decimal('0.001')
+    assert len(calls) == 1
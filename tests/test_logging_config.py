@@ -0,0 +1,23 @@
+"""Tests for the queued logging setup."""
+
+import uuid
+from pathlib import Path
+
+from bot import logging_config
+from bot.logging_config import get_logger, stop_listener
+
+LOG_FILE = Path(logging_config.__file__).parent.parent / "logs" / "trading_bot.log"
+
+
+def test_records_after_stop_are_still_written():
+    logger = get_logger("tests.logging_config")
+    stop_listener()
+    assert logging_config._listener is None
+
+    message = f"after stop {uuid.uuid4()}"
+    logger.debug(message)
+    assert logging_config._listener is not None
+
+    stop_listener()
+    assert message in LOG_FILE.read_text()
+    assert logging_config._log_queue.empty()
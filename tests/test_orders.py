@@ -0,0 +1,76 @@
+"""Tests for OrderService order preparation."""
+
+from decimal import Decimal
+
+import pytest
+
+from bot.orders import BatchOrderError, OrderService, format_order_summary
+from bot.validators import validate_all_inputs
+
+
+class StubClient:
+    """Records orders instead of sending them."""
+
+    def __init__(self):
+        self.sent = []
+
+    def get_symbol_filters(self, symbol, order_type):
+        step_size = Decimal('0.01') if order_type == 'MARKET' else Decimal('0.001')
+        return step_size, Decimal('0.1')
+
+    def place_market_order(self, symbol, side, quantity):
+        self.sent.append((symbol, side, 'MARKET', quantity, None))
+        return {'symbol': symbol, 'side': side, 'type': 'MARKET', 'origQty': quantity}
+
+    def place_limit_order(self, symbol, side, quantity, price):
+        self.sent.append((symbol, side, 'LIMIT', quantity, price))
+        return {'symbol': symbol, 'side': side, 'type': 'LIMIT',
+                'origQty': quantity, 'price': price}
+
+
+def test_limit_order_sends_quantized_values():
+    client = StubClient()
+    details = OrderService(client).place_order('BTCUSDT', 'BUY', 'LIMIT', 0.0015, 100.05)
+
+    assert client.sent == [('BTCUSDT', 'BUY', 'LIMIT', '0.001', '100')]
+    assert details['origQty'] == '0.001'
+    assert details['price'] == '100'
+
+
+def test_summary_shows_sent_values():
+    client = StubClient()
+    prepared = OrderService(client)._prepare(
+        validate_all_inputs('ETHUSDT', 'SELL', 'LIMIT', 0.0015, 100.05)
+    )
+
+    assert format_order_summary(prepared) == (
+        "Symbol=ETHUSDT, Side=SELL, Type=LIMIT, Quantity=0.001, Price=100.1"
+    )
+
+
+def test_market_order_uses_market_step():
+    client = StubClient()
+    OrderService(client).place_order('BTCUSDT', 'SELL', 'MARKET', 0.0159)
+
+    assert client.sent == [('BTCUSDT', 'SELL', 'MARKET', '0.01', None)]
+
+
+def test_batch_partial_failure_keeps_every_outcome_in_order():
+    class FailingClient(StubClient):
+        def place_market_order(self, symbol, side, quantity):
+            if symbol == 'ETHUSDT':
+                raise RuntimeError("rejected")
+            return super().place_market_order(symbol, side, quantity)
+
+    orders = [
+        dict(symbol=symbol, side='BUY', order_type='MARKET', quantity=1)
+        for symbol in ('BTCUSDT', 'ETHUSDT', 'BNBUSDT')
+    ]
+
+    with pytest.raises(BatchOrderError) as excinfo:
+        OrderService(FailingClient()).place_orders(orders)
+
+    first, failed, last = excinfo.value.results
+    assert first['symbol'] == 'BTCUSDT'
+    assert isinstance(failed, RuntimeError)
+    assert last['symbol'] == 'BNBUSDT'
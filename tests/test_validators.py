@@ -0,0 +1,79 @@
+"""Tests for order value validation and rounding."""
+
+from decimal import Decimal
+
+import pytest
+
+from bot.validators import (
+    quantize_price,
+    quantize_quantity,
+    validate_price,
+    validate_quantity,
+)
+
+
+def test_quantity_rounds_down_to_step():
+    assert quantize_quantity(0.0015, Decimal('0.001')) == '0.001'
+    assert quantize_quantity(0.0042, Decimal('0.00100000')) == '0.004'
+
+
+def test_quantity_on_step_is_unchanged():
+    assert quantize_quantity(0.003, Decimal('0.001')) == '0.003'
+    assert quantize_quantity(100.0, Decimal('1')) == '100'
+
+
+def test_quantity_below_step_is_rejected():
+    with pytest.raises(ValueError, match="step size 0.001"):
+        quantize_quantity(0.0001, Decimal('0.001'))
+
+
+def test_zero_step_disables_quantity_rounding():
+    assert quantize_quantity(1.23456, Decimal('0')) == '1.23456'
+
+
+def test_buy_price_rounds_down():
+    assert quantize_price(100.05, Decimal('0.1'), 'BUY') == '100'
+    assert quantize_price(3500.59, Decimal('0.10'), 'BUY') == '3500.5'
+
+
+def test_sell_price_rounds_up():
+    assert quantize_price(100.05, Decimal('0.1'), 'SELL') == '100.1'
+    assert quantize_price(3500.51, Decimal('0.10'), 'SELL') == '3500.6'
+
+
+@pytest.mark.parametrize('side', ['BUY', 'SELL'])
+def test_price_on_tick_is_unchanged(side):
+    assert quantize_price(3500.5, Decimal('0.10'), side) == '3500.5'
+    assert quantize_price(0.3, Decimal('0.1'), side) == '0.3'
+
+
+def test_price_uses_non_power_of_ten_tick():
+    assert quantize_price(100.07, Decimal('0.05'), 'BUY') == '100.05'
+    assert quantize_price(100.07, Decimal('0.05'), 'SELL') == '100.1'
+
+
+def test_buy_price_below_tick_is_rejected():
+    with pytest.raises(ValueError, match="tick size 0.1"):
+        quantize_price(0.05, Decimal('0.1'), 'BUY')
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', float('nan')])
+def test_non_finite_quantity_is_rejected(value):
+    with pytest.raises(ValueError, match="finite"):
+        validate_quantity(value)
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf'])
+def test_non_finite_limit_price_is_rejected(value):
+    with pytest.raises(ValueError, match="finite"):
+        validate_price(value, 'LIMIT')
+
+
+def test_quantity_too_large_for_step_is_rejected():
+    with pytest.raises(ValueError, match="too large"):
+        quantize_quantity(1e40, Decimal('0.001'))
+
+
+def test_non_finite_value_is_rejected_by_quantize():
+    with pytest.raises(ValueError, match="finite"):
+        quantize_price(float('inf'), Decimal('0.1'), 'BUY')